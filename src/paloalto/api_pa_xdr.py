@@ -16,7 +16,6 @@ Functions:
 - get_endpoint_network_details(endpoint_id: str) -> dict: Retrieves network details for a specific endpoint from the Cortex XDR API.
 """
 
-import json
 import logging
 from typing import Optional, List
 import requests
@@ -66,7 +65,7 @@ def get_incidents(query: Optional[str] = None) -> List[dict]:
         response.raise_for_status()  # Raise an exception if the response status code is not 200
 
         # Parse the response JSON
-        response_json = json.loads(response.text)
+        response_json = response.json()
 
         # Return the list of incidents
         return response_json["reply"]
@@ -133,7 +132,7 @@ def get_alerts(query: Optional[str] = None) -> List[dict]:
         response.raise_for_status()  # Raise an exception if the response status code is not 200
 
         # Parse the response JSON
-        response_json = json.loads(response.text)
+        response_json = response.json()
 
         # Return the list of alerts
         return response_json["reply"]
@@ -163,7 +162,7 @@ def get_endpoint_details(endpoint_id: str) -> dict:
         response.raise_for_status()  # Raise an exception if the response status code is not 200
 
         # Parse the response JSON
-        response_json = json.loads(response.text)
+        response_json = response.json()
 
         # Return the endpoint details
         return response_json["reply"]
@@ -193,7 +192,7 @@ def get_incident_details(incident_id: str) -> dict:
         response.raise_for_status()  # Raise an exception if the response status code is not 200
 
         # Parse the response JSON
-        response_json = json.loads(response.text)
+        response_json = response.json()
 
         # Return the incident details
         return response_json["reply"]
@@ -223,7 +222,7 @@ def get_alert_details(alert_id: str) -> dict:
         response.raise_for_status()  # Raise an exception if the response status code is not 200
 
         # Parse the response JSON
-        response_json = json.loads(response.text)
+        response_json = response.json()
 
         # Return the alert details
         return response_json["reply"]
@@ -260,7 +259,7 @@ def isolate_endpoint(endpoint_id: str) -> dict:
         response.raise_for_status()  # Raise an exception if the response status code is not 200
 
         # Parse the response JSON
-        response_json = json.loads(response.text)
+        response_json = response.json()
 
         # Return the response from the Cortex XDR API
         return response_json
@@ -297,7 +296,7 @@ def unisolate_endpoint(endpoint_id: str) -> dict:
         response.raise_for_status()  # Raise an exception if the response status code is not 200
 
         # Parse the response JSON
-        response_json = json.loads(response.text)
+        response_json = response.json()
 
         # Return the response from the Cortex XDR API
         return response_json
@@ -334,7 +333,7 @@ def get_endpoint_quarantine_status(endpoint_id: str) -> dict:
         response.raise_for_status()  # Raise an exception if the response status code is not 200
 
         # Parse the response JSON
-        response_json = json.loads(response.text)
+        response_json = response.json()
 
         # Return the quarantine status for the endpoint
         return response_json["reply"]
@@ -371,7 +370,7 @@ def quarantine_endpoint(endpoint_id: str) -> dict:
         response.raise_for_status()  # Raise an exception if the response status code is not 200
 
         # Parse the response JSON
-        response_json = json.loads(response.text)
+        response_json = response.json()
 
         # Return the response from the Cortex XDR API
         return response_json
@@ -408,7 +407,7 @@ def unquarantine_endpoint(endpoint_id: str) -> dict:
         response.raise_for_status()  # Raise an exception if the response status code is not 200
 
         # Parse the response JSON
-        response_json = json.loads(response.text)
+        response_json = response.json()
 
         # Return the response from the Cortex XDR API
         return response_json
@@ -445,7 +444,7 @@ def get_endpoint_network_details(endpoint_id: str) -> dict:
         response.raise_for_status()  # Raise an exception if the response status code is not 200
 
         # Parse the response JSON
-        response_json = json.loads(response.text)
+        response_json = response.json()
 
         # Return the network details for the endpoint
         return response_json["reply"]
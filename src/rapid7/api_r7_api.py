@@ -2,12 +2,12 @@
 TODO: Add docstring
 """
 
-import collections
 from typing import Any, Tuple
 import logging
 import urllib3
 import requests
 from src.rapid7.api_r7_auth_class import R7_ISVM_Auth
+from src.rapid7.api_r7_session import create_session
 
 # Set up logging
 logging.basicConfig(filename="api_r7_api.log", level=logging.ERROR)
@@ -22,6 +22,13 @@ class R7_ISVM_Api:
         self.api_name = api_name
         self.timeout = timeout
 
+        # Reuse one pooled, keep-alive session for every call made by this client;
+        # GETs are retried on 429/502/503/504, POSTs are not since they may not be idempotent
+        self.session = create_session(pool_connections=16, pool_maxsize=32)
+
+        # Send the Authorization header on every request made by the session
+        self.session.headers.update(auth.get_isvm_encoded_auth_header())
+
     def _get_api_url(self, call_name: str) -> str:
         """
         Returns the API URL.
@@ -59,8 +66,8 @@ class R7_ISVM_Api:
         if json_value is None:
             json_value = {}
         url = self._get_api_url(call_name)
-        headers = self.auth.get_isvm_encoded_auth_header()
-        self.extend_dict(headers, header_params)
+        # The session already carries the auth header; requests merges these on top
+        headers = header_params
 
         return self._execute_call(
             url=url,
@@ -84,44 +91,14 @@ class R7_ISVM_Api:
         Returns:
             A requests.Response object containing the API response.
         """
-        response = None
-        if method == "get":
-            response = requests.get(
-                url, headers=headers, params=params, timeout=self.timeout
-            )
-        elif method == "post":
-            response = requests.post(
-                url, headers=headers, json=json_value, timeout=self.timeout
-            )
-        elif method == "put":
-            response = requests.put(
-                url, headers=headers, json=json_value, timeout=self.timeout
-            )
-        elif method == "delete":
-            response = requests.delete(url, headers=headers, timeout=self.timeout)
-        if response is not None:
-            response.raise_for_status()
-        else:
-            response = requests.Response()
+        response = self.session.request(
+            method.upper(),
+            url,
+            headers=headers,
+            params=params or None,
+            json=json_value if method in ("post", "put") else None,
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
         return response
 
-    @staticmethod
-    def extend_dict(*args):
-        """
-        Extends a dictionary with the key-value pairs from one or more dictionaries.
-
-        Args:
-            *args: One or more dictionaries to extend.
-
-        Returns:
-            A dictionary containing the extended key-value pairs.
-        """
-        if args is not None:
-            if type(args[0]) is collections.OrderedDict:
-                result = collections.OrderedDict()
-            else:
-                result = {}
-            for arg in args:
-                result.update(arg)
-            return result
-        return {}
@@ -2,19 +2,40 @@
 This module provides functions to interact with the Rapid7 InsightVM API to create asset groups.
 """
 
+import copy
 import logging
 import urllib3
-from dotenv import load_dotenv
 import requests
 from api_r7_auth import load_r7_isvm_api_credentials, get_isvm_basic_auth_header
 from src.rapid7.api_r7_isvm_get_assets import API_ENDPOINT
 
-# Load environment variables from .env file
-load_dotenv()
+# Suppress the insecure request warnings raised by verify=False
+urllib3.disable_warnings()
 
 # Set up logging
 logging.basicConfig(filename='api_r7_asset_group.log', level=logging.ERROR)
 
+# Define the payload for the high risk dynamic asset group
+HIGH_RISK_ASSET_GROUP_PAYLOAD = {
+    "description": "Assets with unacceptable high risk required immediate remediation.",
+    "name": "High Risk Assets",
+    "searchCriteria": {
+        "filters": [
+            {
+                "field": "risk-score",
+                "lower": "",
+                "operator": "is-greater-than",
+                "upper": "",
+                "value": 25000,
+                "values": ["string"],
+            }
+        ],
+        "match": "all",
+    },
+    "type": "dynamic",
+    "vulnerabilities": {},
+}
+
 def create_asset_group():
     """
     Creates an asset group based on criteria and prints out the ID with a URL.
@@ -37,7 +58,6 @@ def create_asset_group():
         raise
 
 def _set_up_request():
-    urllib3.disable_warnings()
     # Get the ISVM API credentials and base URL from environment variables
     _, _, isvm_base_url = load_r7_isvm_api_credentials()
     auth_headers = get_isvm_basic_auth_header()
@@ -46,24 +66,7 @@ def _set_up_request():
         "Content-Type": "application/json",
         **auth_headers,
     }
-    payload = {
-        "description": "Assets with unacceptable high risk required immediate remediation.",
-        "name": "High Risk Assets",
-        "searchCriteria": {
-            "filters": [
-                {
-                    "field": "risk-score",
-                    "lower": "",
-                    "operator": "is-greater-than",
-                    "upper": "",
-                    "value": 25000,
-                    "values": ["string"],
-                }
-            ],
-            "match": "all",
-        },
-        "type": "dynamic",
-        "vulnerabilities": {},
-    }
+    # Copy the payload so changes made by the caller never reach the module constant
+    payload = copy.deepcopy(HIGH_RISK_ASSET_GROUP_PAYLOAD)
     return url, headers, payload
 
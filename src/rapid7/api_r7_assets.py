@@ -3,11 +3,9 @@ This module provides functions for retrieving and storing assets from the Insigh
 """
 import logging
 import sqlite3
-from dotenv import load_dotenv
 from .api_r7_isvm import get_assets_isvm
 from .api_r7_auth import load_r7_isvm_api_credentials, get_isvm_access_token
-# Load environment variables from .env file
-load_dotenv(".env")
+from .api_r7_sqlite import tune_connection
 
 # Load the R7 ISVM API credentials
 isvm_api_username, isvm_api_password, isvm_base_url = load_r7_isvm_api_credentials()
@@ -22,6 +20,7 @@ def store_assets_in_database():
 
     # Connect to the local SQLite database
     conn = sqlite3.connect('isvm_assets.db')
+    tune_connection(conn)
     cursor = conn.cursor()
 
     # Create the assets table if it doesn't exist
@@ -33,17 +32,19 @@ def store_assets_in_database():
         assets = get_assets_isvm(isvm_base_url, {}, verify=False)
 
         if assets is not None:
-            # Insert the assets into the database
-            for asset in assets.get('resources', []):
-                asset_id = asset.get('id')
-                hostname = asset.get('host-name')
-                os_type = asset.get('os')
-                last_seen = asset.get('last-scan-time')
-
-                cursor.execute(
-                    "INSERT INTO assets VALUES (?, ?, ?, ?)",
-                    (asset_id, hostname, os_type, last_seen)
-                )
+            # Insert the assets into the database in a single batch
+            cursor.executemany(
+                "INSERT INTO assets VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        asset.get('id'),
+                        asset.get('host-name'),
+                        asset.get('os'),
+                        asset.get('last-scan-time')
+                    )
+                    for asset in assets.get('resources', [])
+                ]
+            )
 
             # Commit the changes and close the connection
             conn.commit()
@@ -3,6 +3,7 @@ This module provides functions for loading Rapid7
 InsightVM and Platform API credentials from environment variables.
 
 Functions:
+    load_env: Loads environment variables from the .env file, once per process.
     load_r7_platform_api_credentials: Loads the Rapid7 Insight Platform API credentials from environment variables.
     load_r7_isvm_api_credentials: Loads the Rapid7 InsightVM API credentials from environment variables.
     get_platform_api_headers: Returns the headers required to make Insight Platform API requests.
@@ -22,17 +23,26 @@ However, it is recommended to use access tokens for security reasons.
 import os
 import logging
 import base64
-from dotenv import load_dotenv
+from functools import lru_cache
+from dotenv import find_dotenv, load_dotenv
 import requests
 from requests.auth import HTTPBasicAuth
 
-# Load environment variables from .env file
-load_dotenv()
-
 # Set up logging
 logging.basicConfig(filename='api_r7_auth.log', level=logging.ERROR)
 
 
+@lru_cache(maxsize=1)
+def load_env():
+    """
+    Loads environment variables from the .env file, once per process.
+
+    The .env file is searched for from the current working directory upwards.
+    """
+    load_dotenv(find_dotenv(usecwd=True))
+
+
+@lru_cache(maxsize=1)
 def load_r7_platform_api_credentials():
     """
     Loads the Rapid7 Insight Platform API credentials from environment variables.
@@ -42,6 +52,7 @@ def load_r7_platform_api_credentials():
     Raises:
         ValueError: If any of the required environment variables are missing.
     """
+    load_env()
     r7_platform_api_key = os.getenv('INSIGHT_PLATFORM_API_KEY')
     r7_platform_base_url = os.getenv('INSIGHT_PLATFORM_BASE_URL')
 
@@ -69,6 +80,7 @@ def get_platform_api_headers():
 
     return platform_headers
 
+@lru_cache(maxsize=1)
 def load_r7_isvm_api_credentials():
     """
     Loads the Rapid7 InsightVM API credentials from environment variables.
@@ -78,6 +90,7 @@ def load_r7_isvm_api_credentials():
     Raises:
         ValueError: If any of the required environment variables are missing.
     """
+    load_env()
     isvm_api_username = os.environ.get('INSIGHTVM_API_USERNAME')
     isvm_api_password = os.environ.get('INSIGHTVM_API_PASSWORD')
     isvm_base_url = os.environ.get('INSIGHTVM_BASE_URL')
@@ -88,6 +101,15 @@ def load_r7_isvm_api_credentials():
 
     return isvm_api_username, isvm_api_password, isvm_base_url
 
+@lru_cache(maxsize=1)
+def _get_isvm_encoded_auth_string():
+    """
+    Returns the Base64 encoded hash of the ISVM API username and password, encoded once per process.
+    """
+    isvm_api_username, isvm_api_password, _ = load_r7_isvm_api_credentials()
+    auth_string = f"{isvm_api_username}:{isvm_api_password}"
+    return base64.b64encode(auth_string.encode()).decode()
+
 def get_isvm_basic_auth_header():
     """
     Returns the Authorization header with the Base64 encoded hash of the username and password.
@@ -95,9 +117,4 @@ def get_isvm_basic_auth_header():
     Returns:
         A dictionary containing the Authorization header.
     """
-    isvm_api_username, isvm_api_password, _ = load_r7_isvm_api_credentials()
-    auth_headers = {}
-    auth_string = f"{isvm_api_username}:{isvm_api_password}"
-    encoded_auth_string = base64.b64encode(auth_string.encode()).decode()
-    auth_headers = {"Authorization": f"Basic {encoded_auth_string}"}
-    return auth_headers
+    return {"Authorization": f"Basic {_get_isvm_encoded_auth_string()}"}
@@ -4,10 +4,7 @@ This file contains the R7_ISVM_Auth class for handling authentication with the I
 import os
 import logging
 import base64
-import dotenv
-
-# Load environment variables from .env file
-dotenv.load_dotenv()
+from src.rapid7.api_r7_auth import load_env
 
 # Set up logging
 logging.basicConfig(filename='api_r7_auth.log', level=logging.INFO)
@@ -26,6 +23,8 @@ class R7_ISVM_Auth:
         """
         Initializes the R7Auth class by loading the necessary environment variables and checking for missing credentials.
         """
+        # Load environment variables from the .env file on first use
+        load_env()
         self.isvm_api_username = os.environ.get('INSIGHTVM_API_USERNAME')
         self.isvm_api_password = os.environ.get('INSIGHTVM_API_PASSWORD')
         self.isvm_base_url = os.environ.get('INSIGHTVM_BASE_URL')
@@ -34,6 +33,11 @@ class R7_ISVM_Auth:
             logging.error("Missing ISVM API credentials or BASE URL. Please check .env file.")
             raise ValueError("Missing ISVM API credentials or BASE URL. Please check .env file.")
 
+        # Encode the Authorization header once; the credentials do not change afterwards
+        auth_string = f"{self.isvm_api_username}:{self.isvm_api_password}"
+        encoded_auth_string = base64.b64encode(auth_string.encode()).decode()
+        self._auth_value = f"Basic {encoded_auth_string}"
+
     def get_isvm_encoded_auth_header(self) -> dict[str, str]:
         """
         Returns the Authorization header with the Base64 encoded hash of the username and password.
@@ -41,7 +45,4 @@ class R7_ISVM_Auth:
         Returns:
             A dictionary containing the Authorization header.
         """
-        auth_string = f"{self.isvm_api_username}:{self.isvm_api_password}"
-        encoded_auth_string = base64.b64encode(auth_string.encode()).decode()
-        auth_headers = {"Authorization": f"Basic {encoded_auth_string}"}
-        return auth_headers
+        return {"Authorization": self._auth_value}
@@ -3,8 +3,8 @@ This module provides functions for interacting with the InsightVM API.
 """
 
 from typing import Optional, List, Dict, Any
-import requests
 from .api_r7_auth import load_r7_isvm_api_credentials, get_isvm_access_token
+from .api_r7_session import create_session
 #from platform.api_r7_auth import load_r7_isvm_api_credentials
 
 # Load the InsightVM API credentials
@@ -14,6 +14,9 @@ from .api_r7_auth import load_r7_isvm_api_credentials, get_isvm_access_token
     isvm_base_url,
 ) = load_r7_isvm_api_credentials()
 
+# Reuse one pooled, keep-alive session for every InsightVM request
+SESSION = create_session()
+
 def search_asset_isvm(
     base_url: str,
     headers: dict,
@@ -34,7 +37,7 @@ def search_asset_isvm(
         "match": "all",
         "filters": [{"field": "host-name", "operator": "is", "value": hostname}],
     }
-    response = requests.post(
+    response = SESSION.post(
         url,
         headers=headers,
         json=body,
@@ -65,7 +68,7 @@ def get_asset_isvm(
     :return: Asset (dictionary) or None if there is an error
     """
     url = f"{base_url}/api/3/assets/{asset_id}"
-    response = requests.get(
+    response = SESSION.get(
         url,
         headers=headers,
         timeout=10,
@@ -101,7 +104,7 @@ def get_assets_isvm(
         "page": page,
         "page_size": page_size,
     }
-    response = requests.get(
+    response = SESSION.get(
         url,
         headers=headers,
         params=params,
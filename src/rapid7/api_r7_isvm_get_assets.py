@@ -2,11 +2,16 @@
 This module retrieves assets from the Rapid7 InsightVM API and stores them in a SQLite database.
 """
 
-import json
 import sqlite3
 import logging
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 import requests
 from api_r7_auth import load_r7_isvm_api_credentials, get_isvm_basic_auth_header
+import api_r7_json
+from api_r7_session import create_session
+from api_r7_sqlite import tune_connection
 
 logging.basicConfig(
     filename='api_r7_isvm_get_assets.log',
@@ -21,10 +26,88 @@ API_ENDPOINT = '/api/3/assets'
 # Define the maximum number of assets to retrieve per page
 PAGE_SIZE = 50
 
+# Define the maximum number of pages to retrieve concurrently
+MAX_WORKERS = 8
+
+# Define the connect and read timeouts for each page request
+TIMEOUT = (5, 30)
+
+# Define the number of assets to insert per SQLite transaction
+BATCH_SIZE = 1000
+
+# Reuse one pooled, keep-alive session for every page request
+SESSION = create_session(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504)
+)
+
+# Define the statement used to insert or update a single asset
+INSERT_ASSET_SQL = '''
+    INSERT OR REPLACE INTO assets (
+        id,
+        hostname,
+        ip_address,
+        mac_address,
+        fqdn,
+        netbios_name,
+        operating_system,
+        last_assessed
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Define the asset history types that record a vulnerability assessment
+ASSESSMENT_HISTORY_TYPES = frozenset(['SCAN', 'AGENT-IMPORT', 'SCAN-LOG-IMPORT'])
+
+def _host_name_from(asset, source):
+    """
+    Returns the first of the asset's host names reported by the specified source, or None.
+    """
+    for host_name in asset.get('hostNames', []):
+        if host_name.get('source') == source:
+            return host_name.get('name')
+    return None
+
+def _asset_row(asset):
+    """
+    Builds the INSERT_ASSET_SQL parameter tuple for an asset from the v3 API.
+
+    The v3 asset has no fqdn, netbios_name or last_assessed fields, so these are
+    taken from its DNS and NetBIOS host names and the date of its latest
+    assessment in its history. Any field the asset does not report is stored as NULL.
+    """
+    last_assessed = max(
+        (
+            event.get('date')
+            for event in asset.get('history', [])
+            if event.get('type') in ASSESSMENT_HISTORY_TYPES and event.get('date')
+        ),
+        default=None
+    )
+    return (
+        asset.get('id'),
+        asset.get('hostName'),
+        asset.get('ip'),
+        asset.get('mac'),
+        _host_name_from(asset, 'dns'),
+        _host_name_from(asset, 'netbios'),
+        asset.get('os'),
+        last_assessed
+    )
+
 def get_all_assets():
     """
     Retrieves all assets from the InsightVM API and returns them as a list of dictionaries.
     """
+    return list(iter_assets())
+
+def iter_assets():
+    """
+    Retrieves all assets from the InsightVM API, yielding them one at a time as each page arrives.
+
+    At most MAX_WORKERS pages are requested ahead of the consumer, so no more than
+    MAX_WORKERS * PAGE_SIZE assets are held waiting to be yielded.
+    """
     # Get the ISVM API credentials and base URL from environment variables
     _, _, isvm_base_url = load_r7_isvm_api_credentials()
 
@@ -32,42 +115,65 @@ def get_all_assets():
     headers = {
         'Accept': 'application/json;charset=UTF-8',
         'Content-Type': 'application/json',
-        get_isvm_basic_auth_header()
+        **get_isvm_basic_auth_header()
     }
 
+    url = isvm_base_url + API_ENDPOINT
+
+    # Retrieve the first page, which also reports the total number of pages
+    data = _get_assets_page(url, headers, 0)
+    if data is None:
+        return
+
+    yield from data.get('resources', [])
+    total_pages = data.get('page', {}).get('totalPages', 1)
+
+    # Retrieve the remaining pages concurrently, yielding them in page order
+    # with at most MAX_WORKERS page requests in flight at a time
+    executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+    remaining_pages = iter(range(1, total_pages))
+    pending = deque(
+        executor.submit(_get_assets_page, url, headers, page)
+        for page in islice(remaining_pages, MAX_WORKERS)
+    )
+    try:
+        while pending:
+            data = pending.popleft().result()
+            if data is None:
+                break
+
+            # Request the next page before handing this one to the consumer
+            for page in islice(remaining_pages, 1):
+                pending.append(executor.submit(_get_assets_page, url, headers, page))
+
+            yield from data.get('resources', [])
+    finally:
+        # Stop requesting pages after a failure or when the consumer stops early
+        executor.shutdown(wait=False, cancel_futures=True)
+
+def _get_assets_page(url, headers, page):
+    """
+    Retrieves a single page of assets from the InsightVM API.
+
+    Returns:
+        The parsed API response, or None if the request failed.
+    """
     # Define the parameters for the API request
     params = {
         'size': PAGE_SIZE,
-        'page': 0
+        'page': page
     }
 
-    # Initialize the list of assets
-    assets = []
-
-    # Loop through all pages of assets
-    while True:
-        # Make the API request
-        response = requests.get(isvm_base_url + API_ENDPOINT, headers=headers, params=params, verify=False)
-
-        # Check if the API request was successful
-        if response.status_code != 200:
-            logging.error('Failed to retrieve assets from the InsightVM API: %s', response.text)
-            break
-
-        # Parse the API response
-        data = json.loads(response.text)
-
-        # Add the assets from the current page to the list
-        assets.extend(data['assets'])
+    # Transient failures are retried with backoff by the session before this raises
+    try:
+        response = SESSION.get(url, headers=headers, params=params, timeout=TIMEOUT, verify=False)
+        response.raise_for_status()
+    except requests.exceptions.RequestException as error:
+        logging.error('Failed to retrieve page %s of assets from the InsightVM API: %s', page, error)
+        return None
 
-        # Check if there are more pages of assets
-        if data['pagination']['next_page'] is None:
-            break
-
-        # Update the parameters for the next page of assets
-        params['page'] = data['pagination']['next_page']
-
-    return assets
+    # Parse the API response
+    return api_r7_json.loads(response)
 
 def create_assets_table(conn):
     """
@@ -90,32 +196,20 @@ def create_assets_table(conn):
 
 def insert_assets(conn, assets):
     """
-    Inserts the specified assets into the assets table in the SQLite database.
+    Inserts the specified assets into the assets table in the SQLite database,
+    committing every BATCH_SIZE assets so any iterable of assets can be streamed in.
+
+    Only one batch of rows is held at a time; streaming from iter_assets() adds
+    at most MAX_WORKERS pages of assets waiting to be inserted.
     """
     cursor = conn.cursor()
-    for asset in assets:
-        cursor.execute('''
-            INSERT OR REPLACE INTO assets (
-                id,
-                hostname,
-                ip_address,
-                mac_address,
-                fqdn,
-                netbios_name,
-                operating_system,
-                last_assessed
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            asset['id'],
-            asset['host_name'],
-            asset['ip_address'],
-            asset['mac_address'],
-            asset['fqdn'],
-            asset['netbios_name'],
-            asset['operating_system'],
-            asset['last_assessed']
-        ))
-    conn.commit()
+    rows = map(_asset_row, assets)
+    while True:
+        batch = list(islice(rows, BATCH_SIZE))
+        if not batch:
+            break
+        cursor.executemany(INSERT_ASSET_SQL, batch)
+        conn.commit()
 
 def main():
     """
@@ -123,15 +217,13 @@ def main():
     """
     # Connect to the SQLite database
     conn = sqlite3.connect('assets.db')
+    tune_connection(conn)
 
     # Create the assets table if it doesn't exist
     create_assets_table(conn)
 
-    # Retrieve all assets from the InsightVM API
-    assets = get_all_assets()
-
-    # Insert the assets into the SQLite database
-    insert_assets(conn, assets)
+    # Stream the assets from the InsightVM API into the SQLite database
+    insert_assets(conn, iter_assets())
 
     # Close the database connection
     conn.close()
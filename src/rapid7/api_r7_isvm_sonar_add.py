@@ -1,47 +1,158 @@
 """This script demonstrates how to create a Sonar Query in InsightVM using the API."""
 
 import ipaddress
+import itertools
+import os
 import re
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
-import requests
 from dotenv import dotenv_values
 from requests.auth import HTTPBasicAuth
+import api_r7_json
+from api_r7_session import create_session
 from api_r7_status_codes import create_sonar_query_sm
 
-secrets = dotenv_values(".env")
+# Reuse one pooled, keep-alive session for every Sonar Query request
+SESSION = create_session(pool_maxsize=32, status_forcelist=(502, 503, 504))
 
-def load_csv(filepath):
+# Define the connect and read timeouts for each request
+TIMEOUT = (5, 30)
+
+# Define the maximum number of Sonar Queries to create concurrently
+MAX_WORKERS = 8
+
+# Define the number of CSV rows to load and process at a time
+CHUNK_SIZE = 10_000
+
+# Pattern used to tell domain targets apart from IP addresses and ranges
+DOMAIN_RE = re.compile(r'^[a-z0-9]+([\-\.]{1}[a-z0-9]+)*\.[a-z]{2,5}$')
+
+@lru_cache(maxsize=1)
+def load_secrets():
     """
-    Load a CSV file and return it as a DataFrame, automatically stripping whitespace from headers.
+    Load the InsightVM host and credentials from the .env file, once per process.
     """
-    df = pd.read_csv(filepath, skipinitialspace=True)
-    return df
+    return dotenv_values(".env")
+
+def load_csv(filepath, chunksize=CHUNK_SIZE):
+    """
+    Load a CSV file as an iterator of DataFrame chunks, automatically stripping whitespace from headers.
+
+    Every column is read as strings, with blank cells kept blank, so pandas skips type
+    inference and each column is written back exactly as read whichever chunk it is in.
+    """
+    return pd.read_csv(
+        filepath,
+        skipinitialspace=True,
+        dtype=str,
+        keep_default_na=False,
+        chunksize=chunksize
+    )
+
+def build_target_filter(target, is_domain):
+    """Build the Sonar Query filter for a single target.
+
+    Args:
+        target (str): The domain, IP address or CIDR range to query.
+        is_domain (bool): Whether the target matched the domain pattern.
+
+    Returns:
+        dict: The filter for the target, or None if the target is invalid.
+    """
+    if is_domain:
+        return {
+            "type": "domain-contains",
+            "domain": target
+        }
+    try:
+        # Check if target is an IP or IP range
+        ip_range = ipaddress.ip_network(target, strict=False)
+    except ValueError:
+        return None
+    return {
+        "type": "ip-address-range",
+        "lower": str(ip_range.network_address),
+        "upper": str(ip_range.broadcast_address)
+    }
 
-def create_sonar_query(url, name, criteria, username, password):
+def create_sonar_query(session, url, name, criteria):
     """Send a POST request to create a Sonar Query.
 
     Args:
+        session (requests.Session): The authenticated session to send the request with.
         url (str): The API endpoint.
         name (str): The name of the Sonar Query.
         criteria (dict): The criteria for the Sonar Query.
-        username (str): The username for authentication.
-        password (str): The password for authentication.
 
     Returns:
         tuple: The status code and response text from the API.
     """
-    headers = {'Content-Type': 'application/json'}
     payload = {
         "name": name,
         "criteria": criteria
     }
-    response = requests.post(url, auth=HTTPBasicAuth(username, password), headers=headers, json=payload, timeout=10, verify=False)
+    response = session.post(
+        url,
+        data=api_r7_json.dumps(payload),
+        headers={'Content-Type': 'application/json'},
+        timeout=TIMEOUT,
+        verify=False
+    )
 
     # Get the user-friendly message based on the status code
     message = create_sonar_query_sm(response.status_code, response)
 
     return response.status_code, message
 
+def create_chunk_queries(df, session, url, scan_date_filter, results, executor):
+    """Create the Sonar Queries for one chunk of the CSV file.
+
+    Targets already present in results, from earlier chunks, are not sent again.
+
+    Args:
+        df (DataFrame): The chunk of CSV rows to process.
+        session (requests.Session): The authenticated session to send the requests with.
+        url (str): The API endpoint.
+        scan_date_filter (dict): The scan date filter shared by every query.
+        results (dict): The status code and response for each target created so far; updated in place.
+        executor (ThreadPoolExecutor): The executor used to send the requests concurrently.
+
+    Returns:
+        DataFrame: The cleaned chunk with status code and response columns added.
+    """
+    # Clean data by stripping any leading/trailing whitespace from string columns
+    obj_cols = df.select_dtypes('object').columns
+    df[obj_cols] = df[obj_cols].apply(lambda col: col.str.strip())
+
+    # Classify each new unique target in one vectorized pass
+    targets = df['target'].drop_duplicates()
+    targets = targets[~targets.isin(list(results))]
+    is_domain = targets.str.match(DOMAIN_RE, na=False)
+
+    # Build the criteria for each new target up front
+    queries = []
+    for target, target_is_domain in zip(targets, is_domain):
+        target_filter = build_target_filter(target, target_is_domain)
+        if target_filter is None:
+            print(f"Invalid target: {target}")
+            continue
+
+        criteria = {"filters": [target_filter, scan_date_filter]}
+        queries.append((target, criteria))
+
+    # Create the Sonar Queries concurrently over the session
+    responses = executor.map(
+        lambda query: create_sonar_query(session, url, *query),
+        queries
+    )
+    results.update({target: result for (target, _), result in zip(queries, responses)})
+
+    # Join the status code and response back onto every row of its target
+    df['status_code'] = df['target'].map(lambda t: results.get(t, ('', ''))[0])
+    df['response'] = df['target'].map(lambda t: results.get(t, ('', ''))[1])
+    return df
+
 def main():
     """
     Main function to create Sonar queries based on data from a CSV file.
@@ -56,6 +167,7 @@ def main():
         None
     """
     filepath = 'test.csv'  # Update with your file path
+    secrets = load_secrets()
     ivm_host = secrets['ivm_host']
     ivm_port = secrets['ivm_port']
     username = secrets['ivm_username']
@@ -63,64 +175,44 @@ def main():
     # Construct the URL using the host and port
     url = f'https://{ivm_host}:{ivm_port}/api/3/sonar_queries'  # API endpoint
 
+    # Authenticate every request made by the shared session
+    SESSION.auth = HTTPBasicAuth(username, password)
+
+    # Write the updated rows to a temporary file as each chunk completes
+    output_path = f"{filepath}.tmp"
+    results = {}
+
     # Load data
-    df = load_csv(filepath)
-
-    # Verify that the CSV file has the correct format
-    if 'target' not in df.columns:
-        print("CSV file is not formatted correctly. It should have a 'target' column.")
-        return
-
-    # Add new columns for status code and response
-    df['status_code'] = ''
-    df['response'] = ''
-
-    # Clean data by stripping any leading/trailing whitespace from string data
-    df = df.apply(lambda x: x.map(str.strip) if x.dtype == "object" else x)
-
-    # Prompt for days
-    days = input("Enter the number of days for 'scan-date-within-the-last' (default 30): ").strip()
-    days = int(days) if days.isdigit() else 30
-
-    # Loop over rows in DataFrame
-    for index, row in df.iterrows():
-        filters = []
-        target = row['target']
-
-        # Check if target is a domain
-        if re.match(r'^[a-z0-9]+([\-\.]{1}[a-z0-9]+)*\.[a-z]{2,5}$', target):
-            filters.append({
-                "type": "domain-contains",
-                "domain": target
-            })
-        else:
-            try:
-                # Check if target is an IP or IP range
-                ip_range = ipaddress.ip_network(target, strict=False)
-                filters.append({
-                    "type": "ip-address-range",
-                    "lower": str(ip_range.network_address),
-                    "upper": str(ip_range.broadcast_address)
-                })
-            except ValueError:
-                print(f"Invalid target: {target}")
-                continue
-
-        filters.append({
-            "type": "scan-date-within-the-last",
-            "days": days
-        })
+    with load_csv(filepath) as chunks:
+        first_chunk = next(chunks, None)
 
-        criteria = {"filters": filters}
-        name = target
-        status_code, response_text = create_sonar_query(url, name, criteria, username, password)
+        # Verify that the CSV file has the correct format
+        if first_chunk is None or 'target' not in first_chunk.columns:
+            print("CSV file is not formatted correctly. It should have a 'target' column.")
+            return
 
-        # Update status code and response in the DataFrame
-        df.at[index, 'status_code'] = status_code
-        df.at[index, 'response'] = response_text
+        # Prompt for days
+        days = input("Enter the number of days for 'scan-date-within-the-last' (default 30): ").strip()
+        days = int(days) if days.isdigit() else 30
 
-    # Save the updated DataFrame to the CSV file
-    df.to_csv(filepath, index=False)
+        # Every query shares the same scan date filter, so build it once
+        scan_date_filter = {
+            "type": "scan-date-within-the-last",
+            "days": days
+        }
+
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for chunk_number, df in enumerate(itertools.chain([first_chunk], chunks)):
+                df = create_chunk_queries(df, SESSION, url, scan_date_filter, results, executor)
+                df.to_csv(
+                    output_path,
+                    mode='a' if chunk_number else 'w',
+                    header=chunk_number == 0,
+                    index=False
+                )
+
+    # Replace the CSV file with the updated rows
+    os.replace(output_path, filepath)
 
     print("Status code and response added to the CSV file.")
 
@@ -0,0 +1,39 @@
+"""
+This module encodes and decodes InsightVM API JSON, using orjson when it is installed.
+"""
+
+import json
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+
+def loads(response):
+    """
+    Decodes the JSON body of an API response, parsing the raw bytes directly when orjson is available.
+
+    Args:
+        response (requests.Response): The API response to decode.
+
+    Returns:
+        The decoded JSON body.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def dumps(obj):
+    """
+    Encodes an object as a JSON request body.
+
+    Args:
+        obj: The object to encode.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON body.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
@@ -0,0 +1,50 @@
+"""
+This module builds the pooled, keep-alive requests sessions shared by the InsightVM API scripts.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_session(
+    pool_connections=4,
+    pool_maxsize=16,
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=Retry.DEFAULT_ALLOWED_METHODS
+):
+    """
+    Creates a requests session that reuses pooled connections and retries transient failures.
+
+    Once retries run out the last response is returned rather than raising a RetryError,
+    so callers handle a persistent error status the same way as one that was never retried.
+
+    Args:
+        pool_connections (int): The number of connection pools to cache, one per host.
+        pool_maxsize (int): The maximum number of connections to keep open per pool.
+        total (int): The maximum number of retries for a single request.
+        backoff_factor (float): The backoff factor applied between retries.
+        status_forcelist (tuple): The response status codes to retry.
+        allowed_methods (frozenset): The HTTP methods retried on those status codes.
+            urllib3's default leaves out non-idempotent methods such as POST.
+
+    Returns:
+        requests.Session: The configured session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=total,
+            backoff_factor=backoff_factor,
+            status_forcelist=status_forcelist,
+            allowed_methods=allowed_methods,
+            raise_on_status=False
+        )
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
@@ -0,0 +1,20 @@
+"""
+This module holds the SQLite settings shared by the InsightVM asset databases.
+"""
+
+# Define the SQLite settings applied to every new connection
+SQLITE_PRAGMAS = (
+    'journal_mode=WAL',
+    'synchronous=NORMAL',
+    'temp_store=MEMORY',
+    'cache_size=-65536',
+    'busy_timeout=5000'
+)
+
+
+def tune_connection(conn):
+    """
+    Applies the WAL journaling and sync PRAGMAs to a new SQLite connection.
+    """
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute('PRAGMA ' + pragma)
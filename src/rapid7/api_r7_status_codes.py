@@ -1,15 +1,23 @@
 """This module contains functions to return user-friendly messages based on status codes."""
+import api_r7_json
+
+# Map each known error status code to the prefix for the message in its response body;
+# 200 is handled by its own fast path in create_sonar_query_sm
+SONAR_QUERY_MESSAGES = {
+    400: "Bad Request: ",
+    401: "Unauthorized: ",
+    500: "Internal Server Error: ",
+    503: "Service Unavailable: ",
+}
+
 def create_sonar_query_sm(status_code, response):
     """Return a user-friendly message based on the status code for a Sonar Query."""
+    # Successful creation is by far the most common response
     if status_code == 200:
-        return f"Sonar Query created successfully. ID: {response.json()['id']}"
-    elif status_code == 400:
-        return f"Bad Request: {response.json()['message']}"
-    elif status_code == 401:
-        return f"Unauthorized: {response.json()['message']}"
-    elif status_code == 500:
-        return f"Internal Server Error: {response.json()['message']}"
-    elif status_code == 503:
-        return f"Service Unavailable: {response.json()['message']}"
-    else:
+        return f"Sonar Query created successfully. ID: {api_r7_json.loads(response).get('id', '')}"
+
+    prefix = SONAR_QUERY_MESSAGES.get(status_code)
+    if prefix is None:
         return response.text
+
+    return f"{prefix}{api_r7_json.loads(response).get('message', '')}"